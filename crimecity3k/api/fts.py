@@ -22,7 +22,8 @@ def create_fts_index(conn: duckdb.DuckDBPyConnection) -> None:
     html_body columns. Uses event_id as the document identifier.
 
     The index is idempotent - calling this function multiple times is safe.
-    If the index already exists, it will be dropped and recreated.
+    If the index already exists, it will be dropped and recreated, since FTS
+    indexes are not updated when the events table changes.
 
     Args:
         conn: DuckDB connection with events table and FTS extension loaded
@@ -31,20 +32,14 @@ def create_fts_index(conn: duckdb.DuckDBPyConnection) -> None:
         Requires FTS extension to be installed and loaded before calling.
         The events table must have columns: event_id, type, summary, html_body
     """
-    # Drop existing index if present (makes function idempotent)
-    try:
-        conn.execute("PRAGMA drop_fts_index('events')")
-    except duckdb.CatalogException:
-        # Index doesn't exist, that's fine
-        pass
-
-    # Create FTS index with Swedish stemmer
+    # Create FTS index with Swedish stemmer, replacing any existing one
     conn.execute("""
         PRAGMA create_fts_index(
             'events',
             'event_id',
             'type', 'summary', 'html_body',
-            stemmer='swedish'
+            stemmer='swedish',
+            overwrite=1
         )
     """)
 
@@ -63,12 +63,12 @@ def init_database(events_parquet: Path) -> duckdb.DuckDBPyConnection:
     conn.execute("INSTALL h3 FROM community; LOAD h3")
     conn.execute("INSTALL fts; LOAD fts")
 
-    # Load events with computed H3 cell (hex string format)
+    # Load events with computed H3 cell (UBIGINT index; requests pass hex strings)
     conn.execute(f"""
         CREATE TABLE events AS
         SELECT
             *,
-            h3_latlng_to_cell_string(latitude, longitude, {DEFAULT_H3_RESOLUTION}) AS h3_cell
+            h3_latlng_to_cell(latitude, longitude, {DEFAULT_H3_RESOLUTION}) AS h3_cell
         FROM '{events_parquet}'
         WHERE latitude IS NOT NULL AND longitude IS NOT NULL
     """)
@@ -73,7 +73,8 @@ def query_events(
     if h3_cell:
         if not is_valid_h3_cell(h3_cell):
             raise ValueError(f"Invalid H3 cell ID: {h3_cell}")
-        conditions.append("h3_cell = ?")
+        # Convert the hex string once so the scan compares integers, not strings
+        conditions.append("h3_cell = h3_string_to_h3(?)")
         params.append(h3_cell)
     elif location_name:
         conditions.append("LOWER(location_name) = LOWER(?)")
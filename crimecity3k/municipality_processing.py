@@ -74,7 +74,7 @@ def aggregate_events_to_municipalities(
         "events_file": str(events_file),
         "population_file": str(population_file),
         "output_file": str(temp_file),  # Write to .tmp first
-        "category_types": get_category_types(),  # For Jinja CASE generation
+        "category_types": get_category_types(),  # For the (type, category) lookup table
     }
 
     logger.info("Aggregating events to municipalities")
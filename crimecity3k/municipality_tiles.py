@@ -4,13 +4,14 @@ This module provides functions for exporting municipality-aggregated crime data
 to GeoJSON format and generating PMTiles for web visualization.
 """
 
-import gzip
-import json
+import functools
 import logging
+import shutil
 import subprocess
 from pathlib import Path
 
 import duckdb
+from qck import qck  # type: ignore[import-untyped]
 
 logger = logging.getLogger(__name__)
 
@@ -23,7 +24,9 @@ def export_municipalities_to_geojsonl(
     """Export municipality data to GeoJSONL format.
 
     Joins municipality boundaries (GeoJSON) with aggregated events (Parquet)
-    and outputs newline-delimited GeoJSON with gzip compression.
+    and outputs newline-delimited GeoJSON with gzip compression. The join,
+    JSON serialization and compression all run in DuckDB via the
+    municipality_geojsonl.sql template.
 
     Args:
         boundaries_file: Path to municipality boundaries GeoJSON
@@ -39,65 +42,25 @@ def export_municipalities_to_geojsonl(
     if not events_file.exists():
         raise FileNotFoundError(f"Events file not found: {events_file}")
 
-    # Load boundaries GeoJSON
-    with open(boundaries_file, encoding="utf-8") as f:
-        boundaries = json.load(f)
-
-    # Load events data
-    conn = duckdb.connect()
-    events_df = conn.execute(f"SELECT * FROM '{events_file}'").fetchdf()
-    conn.close()
-
-    # Create lookup by kommun_kod
-    events_lookup = {row["kommun_kod"]: row for _, row in events_df.iterrows()}
-
     # Atomic write pattern
     temp_file = output_file.with_suffix(".tmp")
     output_file.parent.mkdir(parents=True, exist_ok=True)
 
+    sql_path = Path(__file__).parent / "sql" / "municipality_geojsonl.sql"
+    params = {
+        "boundaries_file": str(boundaries_file),
+        "events_file": str(events_file),
+        "output_file": str(temp_file),  # Write to .tmp first
+    }
+
     logger.info("Exporting municipalities to GeoJSONL")
     logger.info(f"  Boundaries: {boundaries_file}")
     logger.info(f"  Events: {events_file}")
     logger.info(f"  Output: {output_file}")
 
-    def get_int(row: dict | None, key: str, default: int = 0) -> int:
-        """Get integer value from row or return default."""
-        return int(row[key]) if row is not None else default
-
-    def get_float(row: dict | None, key: str, default: float = 0.0) -> float:
-        """Get float value from row or return default."""
-        return float(row[key]) if row is not None else default
-
+    conn = duckdb.connect()
     try:
-        with gzip.open(temp_file, "wt", encoding="utf-8") as f:
-            for boundary_feature in boundaries["features"]:
-                # Get kommun_kod from boundary properties
-                kommun_kod = boundary_feature["properties"]["id"]
-
-                # Get events data for this municipality
-                row = events_lookup.get(kommun_kod)
-
-                # Build output feature
-                feature = {
-                    "type": "Feature",
-                    "geometry": boundary_feature["geometry"],
-                    "properties": {
-                        "kommun_kod": kommun_kod,
-                        "kommun_namn": boundary_feature["properties"]["kom_namn"],
-                        "total_count": get_int(row, "total_count"),
-                        "traffic_count": get_int(row, "traffic_count"),
-                        "property_count": get_int(row, "property_count"),
-                        "violence_count": get_int(row, "violence_count"),
-                        "narcotics_count": get_int(row, "narcotics_count"),
-                        "fraud_count": get_int(row, "fraud_count"),
-                        "public_order_count": get_int(row, "public_order_count"),
-                        "weapons_count": get_int(row, "weapons_count"),
-                        "other_count": get_int(row, "other_count"),
-                        "population": get_int(row, "population"),
-                    },
-                }
-
-                f.write(json.dumps(feature, ensure_ascii=False) + "\n")
+        qck(str(sql_path), params=params, connection=conn)
 
         # Atomic rename on success
         temp_file.rename(output_file)
@@ -111,6 +74,21 @@ def export_municipalities_to_geojsonl(
             temp_file.unlink()
         logger.error(f"Municipality GeoJSONL export failed: {e}")
         raise RuntimeError(f"Failed to export municipalities to GeoJSONL: {e}") from e
+    finally:
+        conn.close()
+
+
+@functools.cache
+def tippecanoe_installed() -> bool:
+    """Check whether Tippecanoe is on PATH.
+
+    A PATH lookup instead of running `tippecanoe --version`, so no process is
+    spawned; the answer is cached for the lifetime of the process.
+
+    Returns:
+        True if a tippecanoe executable was found
+    """
+    return shutil.which("tippecanoe") is not None
 
 
 def build_municipality_tippecanoe_command(
@@ -190,19 +168,10 @@ def generate_municipality_pmtiles(
     if not input_file.exists():
         raise FileNotFoundError(f"Input file not found: {input_file}")
 
-    # Check Tippecanoe is installed
-    try:
-        result = subprocess.run(
-            ["tippecanoe", "--version"],
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode != 0:
-            raise RuntimeError("Tippecanoe not available")
-    except FileNotFoundError:
+    if not tippecanoe_installed():
         raise RuntimeError(
             "Tippecanoe is not installed. Install from https://github.com/mapbox/tippecanoe"
-        ) from None
+        )
 
     cmd = build_municipality_tippecanoe_command(input_file, output_file)
 
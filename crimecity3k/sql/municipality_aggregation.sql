@@ -43,26 +43,35 @@ COPY (
         FROM '{{ population_file }}'
     ),
 
-    events_categorized AS (
-        -- Assign semantic categories to events
+    type_categories AS (
+        -- (type, category) lookup, joined by hash instead of a per-row CASE chain
         -- Category mapping generated from data/event_types.toml
-        -- Exclude county-level events (ending in " län") and summary reports
-        SELECT
-            LOWER(location_name) AS location_name_lower,
-            type,
-            CASE
+        -- One row per type (first listed category wins), so a type listed under
+        -- two categories can never double-count its events in the join
+        SELECT DISTINCT ON (type) type, category
+        FROM (VALUES
 {%- for category, types in category_types.items() if category != 'other' and types %}
-                WHEN type IN (
+{%- set outer_last = loop.last %}
+{%- set category_rank = loop.index %}
 {%- for t in types %}
-                    '{{ t }}'{{ ',' if not loop.last else '' }}
+            ('{{ t }}', '{{ category }}', {{ category_rank }}){{ ',' if not (outer_last and loop.last) else '' }}
 {%- endfor %}
-                ) THEN '{{ category }}'
 {%- endfor %}
-                ELSE 'other'
-            END AS category
-        FROM '{{ events_file }}'
-        WHERE type NOT LIKE 'Sammanfattning%'
-          AND location_name NOT LIKE '% län'
+        ) AS t(type, category, category_rank)
+        ORDER BY type, category_rank
+    ),
+
+    events_categorized AS (
+        -- Assign semantic categories to events; unmapped types become 'other'
+        -- Exclude county-level events (ending in " län") and summary reports
+        SELECT
+            LOWER(e.location_name) AS location_name_lower,
+            e.type,
+            COALESCE(tc.category, 'other') AS category
+        FROM '{{ events_file }}' e
+        LEFT JOIN type_categories tc ON tc.type = e.type
+        WHERE e.type NOT LIKE 'Sammanfattning%'
+          AND e.location_name NOT LIKE '% län'
     ),
 
     type_counts AS (
@@ -0,0 +1,69 @@
+-- Municipality GeoJSONL export for Tippecanoe
+--
+-- Joins municipality boundary polygons (GeoJSON FeatureCollection) with the
+-- aggregated municipality events and writes one GeoJSON Feature per line,
+-- gzip-compressed, entirely inside DuckDB.
+--
+-- Key features:
+--   - Boundary geometry is passed through as JSON, never decoded into Python
+--   - LEFT JOIN keeps every boundary; municipalities without events get zeros
+--   - Features keep the order of the input FeatureCollection
+--
+-- Parameters:
+--   {{boundaries_file}} : Path to municipality boundaries GeoJSON
+--   {{events_file}}     : Path to municipality events Parquet
+--   {{output_file}}     : Path for gzip-compressed GeoJSONL (will be created)
+--
+-- Output (one line per municipality):
+--   {"type": "Feature", "geometry": {...}, "properties": {kommun_kod, kommun_namn,
+--    total_count, <category>_count x 8, population}}
+
+COPY (
+    WITH feature_collection AS (
+        -- The whole FeatureCollection is one JSON document
+        SELECT json AS doc
+        FROM read_json_objects(
+            '{{ boundaries_file }}',
+            format = 'unstructured',
+            maximum_object_size = 1073741824
+        )
+    ),
+
+    features AS (
+        SELECT
+            UNNEST(features) AS feature,
+            generate_subscripts(features, 1) AS feature_idx
+        FROM (SELECT json_extract(doc, '$.features[*]') AS features FROM feature_collection)
+    ),
+
+    boundaries AS (
+        SELECT
+            feature_idx,
+            json_extract_string(feature, '$.properties.id') AS kommun_kod,
+            json_extract_string(feature, '$.properties.kom_namn') AS kommun_namn,
+            json_extract(feature, '$.geometry') AS geometry
+        FROM features
+    )
+
+    SELECT
+        'Feature' AS type,
+        b.geometry,
+        STRUCT_PACK(
+            kommun_kod := b.kommun_kod,
+            kommun_namn := b.kommun_namn,
+            total_count := COALESCE(e.total_count, 0),
+            traffic_count := COALESCE(e.traffic_count, 0),
+            property_count := COALESCE(e.property_count, 0),
+            violence_count := COALESCE(e.violence_count, 0),
+            narcotics_count := COALESCE(e.narcotics_count, 0),
+            fraud_count := COALESCE(e.fraud_count, 0),
+            public_order_count := COALESCE(e.public_order_count, 0),
+            weapons_count := COALESCE(e.weapons_count, 0),
+            other_count := COALESCE(e.other_count, 0),
+            population := COALESCE(e.population, 0)
+        ) AS properties
+    FROM boundaries b
+    LEFT JOIN '{{ events_file }}' e ON CAST(e.kommun_kod AS VARCHAR) = b.kommun_kod
+    ORDER BY b.feature_idx
+
+) TO '{{ output_file }}' (FORMAT JSON, COMPRESSION GZIP);
@@ -1,16 +1,49 @@
 """Shared pytest fixtures for CrimeCity3K tests."""
 
+import base64
 import multiprocessing
 import socket
 import time
+import warnings
 from collections.abc import Generator
 from pathlib import Path
+from typing import Any
 
 import duckdb
 import pytest
+from playwright.sync_api import BrowserContext, BrowserType, Page, Route
 
 from crimecity3k.config import Config
 
+# Extension install statements, run once per test session (see pytest_sessionstart)
+DUCKDB_EXTENSION_INSTALLS = [
+    "INSTALL spatial",
+    "INSTALL fts",
+    "INSTALL h3 FROM community",
+]
+
+
+def pytest_sessionstart(session: pytest.Session) -> None:
+    """Install the DuckDB extensions the tests use, once per run.
+
+    Installed extensions persist in DuckDB's extension directory, so fixtures
+    only LOAD them. This runs in the xdist controller before any workers
+    start. A failed install (e.g. offline) is not fatal here, but it is
+    reported as a warning so the LOAD errors in fixtures have an explanation.
+    """
+    if hasattr(session.config, "workerinput"):
+        return
+
+    conn = duckdb.connect(":memory:")
+    try:
+        for statement in DUCKDB_EXTENSION_INSTALLS:
+            try:
+                conn.execute(statement)
+            except duckdb.Error as e:
+                warnings.warn(f"{statement} failed: {e}", stacklevel=1)
+    finally:
+        conn.close()
+
 
 def _find_free_port() -> int:
     """Find an available port for the test server."""
@@ -25,23 +58,27 @@ def _run_server(port: int, root_dir: Path) -> None:
     """Run FastAPI server in subprocess.
 
     This server supports HTTP Range requests (via Starlette's StaticFiles),
-    which PMTiles requires.
+    which PMTiles requires. Access logging is disabled since every test
+    issues many PMTiles range requests.
     """
     import uvicorn
 
     from crimecity3k.api.main import create_app
 
     app = create_app(root_dir)
-    uvicorn.run(app, host="127.0.0.1", port=port, log_level="warning")
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="warning", access_log=False, workers=1)
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def live_server() -> Generator[str]:
     """Start a static file server for E2E tests.
 
     Uses Starlette's StaticFiles which supports HTTP Range requests,
     required for PMTiles to function properly.
 
+    Session-scoped, so under pytest-xdist each worker starts its own server
+    on its own free port and the fixture data is only read, never written.
+
     Serves PMTiles from tests/fixtures/pmtiles/ directory, which are
     generated by `make test-fixtures` before running E2E tests.
 
@@ -72,6 +109,7 @@ def live_server() -> Generator[str]:
             if response.status_code == 200:
                 break
         except (requests.ConnectionError, requests.Timeout):
+            # No browser exists yet, so there is no page condition to wait on
             time.sleep(0.1)
     else:
         # Loop completed without successful health check
@@ -87,55 +125,282 @@ def live_server() -> Generator[str]:
     server_process.join(timeout=5)
 
 
-@pytest.fixture
-def test_config() -> Config:
-    """Create test configuration with safe defaults.
+# Chromium flags for E2E runs. MapLibre needs WebGL; pinning the software
+# rasterizer skips GPU probing on headless CI and keeps rendering deterministic.
+# The backgrounding flags stop Chromium throttling timers and rAF for pages it
+# considers hidden, which would stall MapLibre's render loop between tests.
+CHROMIUM_ARGS = [
+    "--disable-dev-shm-usage",
+    "--no-sandbox",
+    "--use-gl=angle",
+    "--use-angle=swiftshader",
+    "--enable-unsafe-swiftshader",
+    "--disable-background-networking",
+    "--disable-extensions",
+    "--disable-translate",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--disable-background-timer-throttling",
+]
+
+
+# Requests the E2E assertions never look at: the OSM raster basemap tiles are
+# the only images the frontend loads. Only these patterns are routed; every
+# other request (app bundle, PMTiles ranges, API) goes straight to the network.
+BLOCKED_ASSET_GLOB = "**/*.{png,jpg,jpeg,gif,webp,svg,ico,woff,woff2,ttf,otf,mp3,mp4,webm}"
+BLOCKED_HOSTS = ("tile.openstreetmap.org",)
+
+# Basemap tiles are answered with a transparent 1x1 PNG rather than aborted,
+# so MapLibre sees loaded tiles instead of logging an AJAXError for each one.
+BLANK_PNG = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAAC0lEQVR42mNgAAIAAAUAAen63NgAAAAASUVORK5CYII="
+)
+
+
+# Init script for every E2E page: zero out CSS animations/transitions and make
+# MapLibre camera moves (easeTo/flyTo, hence fitBounds) complete instantly.
+# The map is patched the moment app.js assigns window.map.
+DISABLE_ANIMATIONS_JS = """
+(() => {
+    document.addEventListener('DOMContentLoaded', () => {
+        const style = document.createElement('style');
+        style.textContent = '*, *::before, *::after {'
+            + ' animation-duration: 0s !important; animation-delay: 0s !important;'
+            + ' transition-duration: 0s !important; transition-delay: 0s !important; }';
+        document.head.appendChild(style);
+    });
+    let map;
+    Object.defineProperty(window, 'map', {
+        configurable: true,
+        get: () => map,
+        set: (value) => {
+            for (const method of ['easeTo', 'flyTo']) {
+                const original = value[method].bind(value);
+                value[method] = (options, eventData) =>
+                    original({...options, duration: 0, animate: false}, eventData);
+            }
+            map = value;
+        },
+    });
+})();
+"""
+
+
+# Init script exposing window.__municipalityClickPoints(): rendered municipalities
+# whose screen centroid lies at least 50px inside the canvas, closest to the
+# centre first. window.__clickMunicipality() dispatches a map click on the first
+# of them in the same round trip.
+MUNICIPALITY_CLICK_POINTS_JS = """
+(() => {
+    window.__municipalityClickPoints = () => {
+        const map = window.map;
+        const rect = document.querySelector('#map canvas').getBoundingClientRect();
+        const margin = 50;
+        const points = [];
+        for (const feature of map.queryRenderedFeatures({layers: ['municipalities']})) {
+            const geom = feature.geometry;
+            const ring = geom.type === 'Polygon' ? geom.coordinates[0]
+                : geom.type === 'MultiPolygon' ? geom.coordinates[0][0] : null;
+            if (!ring) continue;
+
+            let sumX = 0, sumY = 0, n = 0;
+            for (const coord of ring) {
+                if (!Array.isArray(coord) || coord.length !== 2) continue;
+                const pt = map.project(coord);
+                sumX += pt.x; sumY += pt.y; n++;
+            }
+            if (n === 0) continue;
+
+            const x = sumX / n, y = sumY / n;
+            if (x < margin || x >= rect.width - margin
+                || y < margin || y >= rect.height - margin) continue;
+            const dx = x - rect.width / 2, dy = y - rect.height / 2;
+            points.push({
+                x, y, distToCenter: dx * dx + dy * dy,
+                kommun_namn: feature.properties.kommun_namn,
+                total_count: feature.properties.total_count,
+                rate_per_10000: feature.properties.rate_per_10000,
+            });
+        }
+        points.sort((a, b) => a.distToCenter - b.distToCenter);
+        return points;
+    };
+
+    // Fire MapLibre's click event at the best point without real input
+    window.__clickMunicipality = () => {
+        const best = window.__municipalityClickPoints()[0];
+        if (!best) return null;
+        const map = window.map;
+        const lngLat = map.unproject([best.x, best.y]);
+        map.fire('click', {
+            lngLat,
+            point: map.project(lngLat),
+            originalEvent: {target: map.getCanvas()},
+        });
+        return best;
+    };
+})();
+"""
+
+
+def _stub_basemap_tile(route: Route) -> None:
+    """Answer a basemap tile request with a blank PNG."""
+    route.fulfill(status=200, content_type="image/png", body=BLANK_PNG)
+
+
+def _abort_request(route: Route) -> None:
+    """Drop an image, font or media request."""
+    route.abort()
+
+
+@pytest.fixture(scope="session")
+def browser_context_args(browser_context_args: dict[str, Any]) -> dict[str, Any]:
+    """Fixed 1280x720 viewport at 1x scale so E2E runs don't pay for HiDPI rendering."""
+    return {
+        **browser_context_args,
+        "viewport": {"width": 1280, "height": 720},
+        "device_scale_factor": 1,
+    }
+
+
+@pytest.fixture(scope="session")
+def persistent_context(
+    browser_type: BrowserType,
+    browser_type_launch_args: dict[str, Any],
+    browser_context_args: dict[str, Any],
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Generator[BrowserContext]:
+    """One Chromium instance reused by all E2E tests in the session.
+
+    The browser is launched once per xdist worker instead of once per test;
+    each test still gets a fresh page in this context. Nothing is served from
+    the HTTP cache between tests, because routing (below) disables it.
 
-    Returns:
-        Config object with test-specific settings
+    Yields:
+        Browser context backed by a temporary user data directory
+    """
+    user_data_dir = tmp_path_factory.mktemp("pw_user_data")
+    launch_args = {**browser_type_launch_args}
+    launch_args["args"] = [*launch_args.get("args", []), *CHROMIUM_ARGS]
+    context = browser_type.launch_persistent_context(
+        str(user_data_dir), **launch_args, **browser_context_args
+    )
+    # Playwright runs the most recently registered matching route first, so
+    # basemap tiles are stubbed rather than caught by the asset abort
+    context.route(BLOCKED_ASSET_GLOB, _abort_request)
+    for host in BLOCKED_HOSTS:
+        context.route(f"https://{host}/**", _stub_basemap_tile)
+    context.add_init_script(DISABLE_ANIMATIONS_JS)
+    context.add_init_script(MUNICIPALITY_CLICK_POINTS_JS)
+    yield context
+    context.close()
+
+
+_CALL_FAILED = pytest.StashKey[bool]()
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_makereport(item: pytest.Item, call: pytest.CallInfo[None]) -> Any:
+    """Record whether the test body failed, for the page fixture's trace handling."""
+    report = yield
+    if report.when == "call":
+        item.stash[_CALL_FAILED] = report.failed
+    return report
+
+
+@pytest.fixture
+def page(
+    persistent_context: BrowserContext,
+    pytestconfig: pytest.Config,
+    request: pytest.FixtureRequest,
+    output_path: str,
+) -> Generator[Page]:
+    """Fresh page in the shared persistent context (overrides pytest-playwright).
+
+    Honours pytest-playwright's --tracing option, which its own fixtures can no
+    longer apply to the persistent context: with "on" every test saves a trace,
+    with "retain-on-failure" only failing tests do. The default is "off".
     """
+    tracing = pytestconfig.getoption("--tracing")
+    if tracing != "off":
+        persistent_context.tracing.start(screenshots=True, snapshots=True, sources=True)
+
+    page = persistent_context.new_page()
+    yield page
+    page.close()
+
+    if tracing != "off":
+        failed = request.node.stash.get(_CALL_FAILED, False)
+        keep = tracing == "on" or (tracing == "retain-on-failure" and failed)
+        persistent_context.tracing.stop(path=Path(output_path) / "trace.zip" if keep else None)
+
+
+def _make_test_config(temp_dir: Path) -> Config:
+    """Build the test configuration, with DuckDB spilling to temp_dir."""
     config = Config()
     # Override for tests
     config.aggregation.resolutions = [5]
     config.duckdb.memory_limit = "1GB"
     config.duckdb.threads = 1
-    config.duckdb.temp_directory = "/tmp/test_duckdb"
+    config.duckdb.temp_directory = str(temp_dir)
     return config
 
 
+@pytest.fixture(scope="session")
+def project_config() -> Config:
+    """The repository's config.toml, parsed once per session.
+
+    For pipeline runs over the real data/ inputs, which should use the same
+    settings as `make` does.
+
+    Returns:
+        Config loaded from config.toml
+    """
+    return Config.from_file("config.toml")
+
+
 @pytest.fixture
-def duckdb_conn(
-    test_config: Config,
+def test_config(tmp_path: Path) -> Config:
+    """Create test configuration with safe defaults.
+
+    DuckDB spills to a per-test temp directory so parallel xdist workers
+    never share spill files.
+
+    Returns:
+        Config object with test-specific settings
+    """
+    return _make_test_config(tmp_path / "duckdb_tmp")
+
+
+@pytest.fixture(scope="session")
+def duckdb_session(
+    tmp_path_factory: pytest.TempPathFactory,
 ) -> Generator[duckdb.DuckDBPyConnection]:
-    """In-memory DuckDB with h3 and spatial extensions.
+    """In-memory DuckDB with h3 and spatial extensions, opened once per session.
 
     Following aviation-anomaly pattern for reliable extension loading in CI.
-
-    Args:
-        test_config: Test configuration fixture
+    Under pytest-xdist each worker gets its own database.
 
     Yields:
         Configured DuckDB connection
 
     Note:
-        Connection is automatically closed after test
+        Connection is automatically closed at the end of the session
     """
+    config = _make_test_config(tmp_path_factory.mktemp("duckdb_tmp"))
     conn = duckdb.connect(":memory:")
 
     # Apply basic DuckDB settings
-    conn.execute(f"SET memory_limit = '{test_config.duckdb.memory_limit}'")
-    conn.execute(f"SET threads = {test_config.duckdb.threads}")
+    conn.execute(f"SET memory_limit = '{config.duckdb.memory_limit}'")
+    conn.execute(f"SET threads = {config.duckdb.threads}")
 
-    # Install and load spatial extension (core extension)
+    # Extensions were installed in pytest_sessionstart; only load them here
     try:
-        conn.execute("INSTALL spatial")
         conn.execute("LOAD spatial")
     except Exception as e:
         pytest.skip(f"Spatial extension not available: {e}")
 
-    # Install and load H3 extension from community repository
     try:
-        conn.execute("INSTALL h3 FROM community")
         conn.execute("LOAD h3")
     except Exception as e:
         pytest.fail(f"H3 extension is required but failed to load: {e}")
@@ -145,51 +410,69 @@ def duckdb_conn(
 
 
 @pytest.fixture
-def sample_events(duckdb_conn: duckdb.DuckDBPyConnection) -> duckdb.DuckDBPyConnection:
-    """Load test fixture events into DuckDB.
+def duckdb_conn(
+    duckdb_session: duckdb.DuckDBPyConnection,
+) -> Generator[duckdb.DuckDBPyConnection]:
+    """Cursor on the session DuckDB, with h3 and spatial already loaded.
 
-    Args:
-        duckdb_conn: DuckDB connection fixture
+    Cursors share the session's catalog, so tests that create tables should
+    use names that won't collide or drop them when done.
+
+    Yields:
+        DuckDB cursor
+
+    Note:
+        Cursor is automatically closed after test
+    """
+    cursor = duckdb_session.cursor()
+    yield cursor
+    cursor.close()
+
+
+@pytest.fixture(scope="session")
+def parquet_conn() -> Generator[duckdb.DuckDBPyConnection]:
+    """Plain in-memory DuckDB for reading pipeline outputs, opened once per session.
+
+    Needs no extensions, so tests that only query Parquet files don't pay for
+    loading h3 and spatial or for a fresh database per query.
+
+    Yields:
+        DuckDB connection
+    """
+    conn = duckdb.connect(":memory:")
+    yield conn
+    conn.close()
+
+
+@pytest.fixture(scope="session")
+def _fixture_events_table(duckdb_session: duckdb.DuckDBPyConnection) -> str:
+    """Import the fixture events Parquet into the session DuckDB once.
+
+    Later queries read the in-memory table instead of decoding the Parquet
+    file again.
 
     Returns:
-        DuckDB connection with 'events' table loaded
+        Name of the events table
     """
     fixture_path = Path(__file__).parent / "fixtures" / "data" / "events.parquet"
-    duckdb_conn.execute(f"""
-        CREATE TABLE events AS
-        SELECT * FROM '{fixture_path}'
-    """)
-    return duckdb_conn
+    duckdb_session.execute(
+        "CREATE TABLE events AS SELECT * FROM read_parquet($path)",
+        {"path": str(fixture_path)},
+    )
+    return "events"
 
 
 @pytest.fixture
-def synthetic_population_h3(tmp_path: Path, duckdb_conn: duckdb.DuckDBPyConnection) -> Path:
-    """Create synthetic population data for H3 cells in test fixture.
-
-    Creates a minimal population dataset with 1000 people per H3 cell,
-    covering all cells in the events test fixture.
+def sample_events(
+    duckdb_conn: duckdb.DuckDBPyConnection, _fixture_events_table: str
+) -> duckdb.DuckDBPyConnection:
+    """Test fixture events loaded into DuckDB.
 
     Args:
-        tmp_path: Pytest temporary directory fixture
-        duckdb_conn: DuckDB connection with H3 extension
+        duckdb_conn: DuckDB connection fixture
+        _fixture_events_table: Session-wide events table
 
     Returns:
-        Path to synthetic population Parquet file
+        DuckDB connection with 'events' table loaded
     """
-    fixture_path = Path(__file__).parent / "fixtures" / "data" / "events.parquet"
-    population_path = tmp_path / "synthetic_population_r5.parquet"
-
-    duckdb_conn.execute(f"""
-        COPY (
-            WITH h3_cells AS (
-                SELECT DISTINCT h3_latlng_to_cell_string(latitude, longitude, 5) as h3_cell
-                FROM '{fixture_path}'
-            )
-            SELECT
-                h3_cell,
-                1000.0 as population
-            FROM h3_cells
-        ) TO '{population_path}' (FORMAT PARQUET)
-    """)
-
-    return population_path
+    return duckdb_conn
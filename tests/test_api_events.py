@@ -28,10 +28,8 @@ def events_db() -> Generator[duckdb.DuckDBPyConnection]:
 
     conn = duckdb.connect(":memory:")
 
-    # Load extensions
-    conn.execute("INSTALL fts")
+    # Load extensions (installed once per session in conftest)
     conn.execute("LOAD fts")
-    conn.execute("INSTALL h3 FROM community")
     conn.execute("LOAD h3")
 
     # Load events with computed fields
@@ -48,7 +46,7 @@ def events_db() -> Generator[duckdb.DuckDBPyConnection]:
             location_name,
             latitude,
             longitude,
-            h3_latlng_to_cell_string(latitude, longitude, 5) AS h3_cell
+            h3_latlng_to_cell(latitude, longitude, 5) AS h3_cell
         FROM '{fixture_path}'
         WHERE latitude IS NOT NULL AND longitude IS NOT NULL
     """)
@@ -61,29 +59,29 @@ def events_db() -> Generator[duckdb.DuckDBPyConnection]:
 
 
 @pytest.fixture(scope="module")
-def sample_h3_cell(events_db: duckdb.DuckDBPyConnection) -> str:
-    """Get an H3 cell with many events for testing."""
+def _busiest_h3_cell(events_db: duckdb.DuckDBPyConnection) -> tuple[str, int]:
+    """Find the H3 cell with the most events, along with its event count."""
     result = events_db.execute("""
-        SELECT h3_cell, COUNT(*) as cnt
+        SELECT h3_h3_to_string(h3_cell), COUNT(*) as cnt
         FROM events
         GROUP BY h3_cell
         ORDER BY cnt DESC
         LIMIT 1
     """).fetchone()
     assert result is not None, "No events in test database"
-    cell: str = result[0]
-    return cell
+    return result[0], result[1]
+
+
+@pytest.fixture(scope="module")
+def sample_h3_cell(_busiest_h3_cell: tuple[str, int]) -> str:
+    """Get an H3 cell with many events for testing."""
+    return _busiest_h3_cell[0]
 
 
 @pytest.fixture(scope="module")
-def sample_cell_event_count(events_db: duckdb.DuckDBPyConnection, sample_h3_cell: str) -> int:
+def sample_cell_event_count(_busiest_h3_cell: tuple[str, int]) -> int:
     """Get count of events in sample cell."""
-    result = events_db.execute(f"""
-        SELECT COUNT(*) FROM events WHERE h3_cell = '{sample_h3_cell}'
-    """).fetchone()
-    assert result is not None
-    count: int = result[0]
-    return count
+    return _busiest_h3_cell[1]
 
 
 @pytest.fixture
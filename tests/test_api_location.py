@@ -28,11 +28,9 @@ def events_db() -> Generator[duckdb.DuckDBPyConnection]:
 
     conn = duckdb.connect(":memory:")
 
-    # Load extensions
-    conn.execute("INSTALL fts")
+    # Load extensions (installed once in conftest; no h3: these tests only
+    # query by location_name)
     conn.execute("LOAD fts")
-    conn.execute("INSTALL h3 FROM community")
-    conn.execute("LOAD h3")
 
     # Load events with computed fields
     conn.execute(f"""
@@ -48,7 +46,7 @@ def events_db() -> Generator[duckdb.DuckDBPyConnection]:
             location_name,
             latitude,
             longitude,
-            h3_latlng_to_cell_string(latitude, longitude, 5) AS h3_cell
+            NULL::UBIGINT AS h3_cell
         FROM '{fixture_path}'
         WHERE latitude IS NOT NULL AND longitude IS NOT NULL
     """)
@@ -61,33 +59,36 @@ def events_db() -> Generator[duckdb.DuckDBPyConnection]:
 
 
 @pytest.fixture(scope="module")
-def sample_location(events_db: duckdb.DuckDBPyConnection) -> str:
-    """Get a location_name with many events for testing."""
+def _busiest_location(events_db: duckdb.DuckDBPyConnection) -> tuple[str, int]:
+    """Find the location_name with the most events, along with its event count.
+
+    The count is summed over case-insensitive matches, which is what the API's
+    location filter compares against.
+    """
     result = events_db.execute("""
-        SELECT location_name, COUNT(*) as cnt
+        SELECT
+            location_name,
+            SUM(COUNT(*)) OVER (PARTITION BY LOWER(location_name)) AS total
         FROM events
         WHERE location_name NOT LIKE '% län'
         GROUP BY location_name
-        ORDER BY cnt DESC
+        ORDER BY COUNT(*) DESC
         LIMIT 1
     """).fetchone()
     assert result is not None, "No events in test database"
-    location: str = result[0]
-    return location
+    return result[0], int(result[1])
+
+
+@pytest.fixture(scope="module")
+def sample_location(_busiest_location: tuple[str, int]) -> str:
+    """Get a location_name with many events for testing."""
+    return _busiest_location[0]
 
 
 @pytest.fixture(scope="module")
-def sample_location_event_count(events_db: duckdb.DuckDBPyConnection, sample_location: str) -> int:
+def sample_location_event_count(_busiest_location: tuple[str, int]) -> int:
     """Get count of events in sample location directly from database."""
-    result = events_db.execute(
-        """
-        SELECT COUNT(*) FROM events WHERE LOWER(location_name) = LOWER(?)
-    """,
-        [sample_location],
-    ).fetchone()
-    assert result is not None
-    count: int = result[0]
-    return count
+    return _busiest_location[1]
 
 
 @pytest.fixture
@@ -1,16 +1,16 @@
 """Tests for DuckDB full-text search functionality."""
 
+from collections.abc import Generator
+
 import duckdb
 import pytest
 
 from crimecity3k.api.fts import create_fts_index, search_events
 
 
-@pytest.fixture
-def fts_conn() -> duckdb.DuckDBPyConnection:
-    """Create DuckDB connection with test events and FTS index."""
+def _create_events_conn() -> duckdb.DuckDBPyConnection:
+    """Create DuckDB connection with test events and the FTS extension loaded."""
     conn = duckdb.connect(":memory:")
-    conn.execute("INSTALL fts")
     conn.execute("LOAD fts")
 
     # Create events table with realistic Swedish police event data
@@ -33,15 +33,29 @@ def fts_conn() -> duckdb.DuckDBPyConnection:
         ("6", "Rån", "Rån mot butik", "Maskerade män rånade en kiosk."),
     ]
 
-    for event in test_events:
-        conn.execute(
-            "INSERT INTO events VALUES (?, ?, ?, ?)",
-            event,
-        )
+    conn.executemany("INSERT INTO events VALUES (?, ?, ?, ?)", test_events)
 
     return conn
 
 
+@pytest.fixture
+def fts_conn() -> duckdb.DuckDBPyConnection:
+    """Fresh connection with test events but no FTS index yet."""
+    return _create_events_conn()
+
+
+@pytest.fixture(scope="module")
+def fts_indexed_conn() -> Generator[duckdb.DuckDBPyConnection]:
+    """Connection with test events and FTS index, built once per module.
+
+    Searches are read-only, so tests can share the index safely.
+    """
+    conn = _create_events_conn()
+    create_fts_index(conn)
+    yield conn
+    conn.close()
+
+
 class TestCreateFtsIndex:
     """Tests for FTS index creation."""
 
@@ -62,15 +76,26 @@ class TestCreateFtsIndex:
         create_fts_index(fts_conn)
         create_fts_index(fts_conn)  # Should not raise
 
+    def test_create_fts_index_rebuilds_existing_index(
+        self, fts_conn: duckdb.DuckDBPyConnection
+    ) -> None:
+        """A second call rebuilds the index, picking up rows added since."""
+        create_fts_index(fts_conn)
+        fts_conn.execute(
+            "INSERT INTO events VALUES ('7', 'Brand', 'Brand i förråd', 'Räddningstjänsten kom.')"
+        )
+
+        create_fts_index(fts_conn)
+        assert [r["event_id"] for r in search_events(fts_conn, "förråd")] == ["7"]
+
 
 class TestSearchEvents:
     """Tests for FTS search functionality."""
 
     @pytest.fixture(autouse=True)
-    def setup_fts(self, fts_conn: duckdb.DuckDBPyConnection) -> None:
-        """Create FTS index before each test."""
-        self.conn = fts_conn
-        create_fts_index(fts_conn)
+    def setup_fts(self, fts_indexed_conn: duckdb.DuckDBPyConnection) -> None:
+        """Use the module's shared FTS-indexed connection."""
+        self.conn = fts_indexed_conn
 
     def test_search_matches_type(self) -> None:
         """Search should match event type field."""
@@ -13,132 +13,163 @@ from typing import Any
 import duckdb
 import pytest
 
+from crimecity3k.config import Config
 
-class TestMunicipalityAggregation:
-    """Tests for the municipality aggregation SQL/pipeline."""
 
-    @pytest.fixture(scope="class")
-    def aggregated_data(self) -> list[dict[str, Any]]:
-        """Load aggregated municipality events data."""
-        parquet_path = Path("data/municipalities/events.parquet")
-        if not parquet_path.exists():
-            pytest.skip("Municipality events.parquet not found - run pipeline first")
+@pytest.fixture(scope="module")
+def aggregated_parquet(tmp_path_factory: pytest.TempPathFactory, project_config: Config) -> Path:
+    """Run the municipality aggregation once and share its output across tests."""
+    from crimecity3k.municipality_processing import aggregate_events_to_municipalities
 
-        conn = duckdb.connect()
-        result = conn.execute(f"""
-            SELECT * FROM '{parquet_path}'
-        """).fetchdf()
-        conn.close()
+    events_path = Path("data/events.parquet")
+    population_path = Path("data/municipalities/population.csv")
+    if not events_path.exists() or not population_path.exists():
+        pytest.skip("events.parquet or population.csv not found - run pipeline first")
 
-        records: list[dict[str, Any]] = result.to_dict("records")
-        return records
+    output_path = tmp_path_factory.mktemp("municipalities") / "events.parquet"
+    aggregate_events_to_municipalities(events_path, population_path, output_path, project_config)
+    return output_path
 
-    @pytest.fixture(scope="class")
-    def raw_events_count(self) -> dict[str, int]:
-        """Count raw events by type (county vs municipality)."""
-        events_path = Path("data/events.parquet")
-        if not events_path.exists():
-            pytest.skip("events.parquet not found")
 
-        conn = duckdb.connect()
-        result = conn.execute(f"""
-            SELECT
-                COUNT(*) FILTER (WHERE location_name LIKE '% län') AS county_events,
-                COUNT(*) FILTER (WHERE location_name NOT LIKE '% län') AS municipality_events,
-                COUNT(*) AS total_events
-            FROM '{events_path}'
-            WHERE type NOT LIKE 'Sammanfattning%'
-        """).fetchone()
-        conn.close()
+CATEGORY_COLUMNS = [
+    "traffic_count",
+    "property_count",
+    "violence_count",
+    "narcotics_count",
+    "fraud_count",
+    "public_order_count",
+    "weapons_count",
+    "other_count",
+]
 
-        assert result is not None
-        return {
-            "county": result[0],
-            "municipality": result[1],
-            "total": result[2],
-        }
 
-    def test_output_has_290_municipalities(self, aggregated_data: list[dict[str, Any]]) -> None:
+class TestMunicipalityAggregation:
+    """Tests for the municipality aggregation SQL/pipeline.
+
+    Every test reading aggregated_parquet lives in this class: --dist loadscope
+    schedules classes independently, so a second class would rerun the
+    aggregation on another xdist worker.
+    """
+
+    @pytest.fixture(scope="class")
+    def aggregate_checks(
+        self, aggregated_parquet: Path, parquet_conn: duckdb.DuckDBPyConnection
+    ) -> dict[str, Any]:
+        """Compute every row-level invariant in one scan of the aggregated output.
+
+        Each check returns a count or the list of offending municipalities, so
+        only a single small row crosses into Python.
+        """
+        category_sum = " + ".join(CATEGORY_COLUMNS)
+        cursor = parquet_conn.execute(f"""
+            SELECT
+                COUNT(*) AS rows,
+                COUNT(DISTINCT kommun_kod) AS distinct_codes,
+                SUM(total_count) AS total_events,
+                LIST(kommun_namn) FILTER (WHERE {category_sum} <> total_count)
+                    AS category_sum_mismatches,
+                LIST(kommun_namn) FILTER (WHERE population IS NULL OR population <= 0)
+                    AS zero_population,
+                LIST(kommun_namn) FILTER (
+                    WHERE total_count > 0 AND population > 0
+                    AND abs(rate_per_10000 - total_count / population * 10000) >= 0.001
+                ) AS rate_mismatches,
+                LIST(kommun_namn) FILTER (
+                    WHERE list_transform(type_counts, t -> t.count)
+                        <> list_reverse_sort(list_transform(type_counts, t -> t.count))
+                ) AS unsorted_type_counts
+            FROM '{aggregated_parquet}'
+        """)
+        row = cursor.fetchone()
+        columns = [d[0] for d in cursor.description]
+
+        assert row is not None
+        # LIST() FILTER over no matching rows yields NULL; normalise to []
+        return {col: ([] if val is None else val) for col, val in zip(columns, row, strict=True)}
+
+    def test_output_has_290_municipalities(self, aggregate_checks: dict[str, Any]) -> None:
         """Output contains exactly 290 municipalities (one row each)."""
-        assert len(aggregated_data) == 290
+        assert aggregate_checks["rows"] == 290
 
-    def test_unique_kommun_codes(self, aggregated_data: list[dict[str, Any]]) -> None:
+    def test_unique_kommun_codes(self, aggregate_checks: dict[str, Any]) -> None:
         """All kommun_kod values are unique."""
-        codes = [row["kommun_kod"] for row in aggregated_data]
-        assert len(codes) == len(set(codes))
+        assert aggregate_checks["distinct_codes"] == aggregate_checks["rows"]
 
-    def test_category_counts_sum_to_total(self, aggregated_data: list[dict[str, Any]]) -> None:
+    def test_category_counts_sum_to_total(self, aggregate_checks: dict[str, Any]) -> None:
         """Category counts sum to total_count for each municipality."""
-        categories = [
-            "traffic_count",
-            "property_count",
-            "violence_count",
-            "narcotics_count",
-            "fraud_count",
-            "public_order_count",
-            "weapons_count",
-            "other_count",
-        ]
-
-        for row in aggregated_data:
-            category_sum = sum(row[cat] for cat in categories)
-            assert category_sum == row["total_count"], (
-                f"Category sum {category_sum} != total_count {row['total_count']} "
-                f"for {row['kommun_namn']}"
-            )
+        mismatches = aggregate_checks["category_sum_mismatches"]
+        assert not mismatches, f"Category sum != total_count for: {mismatches}"
 
     def test_county_events_excluded(
-        self,
-        aggregated_data: list[dict[str, Any]],
-        raw_events_count: dict[str, int],
+        self, aggregated_parquet: Path, parquet_conn: duckdb.DuckDBPyConnection
     ) -> None:
         """County-level events (ending in ' län') are excluded."""
-        total_aggregated = sum(row["total_count"] for row in aggregated_data)
+        events_path = Path("data/events.parquet")
 
-        assert total_aggregated == raw_events_count["municipality"], (
+        result = parquet_conn.execute(f"""
+            SELECT
+                (SELECT SUM(total_count) FROM '{aggregated_parquet}'),
+                (SELECT COUNT(*) FROM '{events_path}'
+                 WHERE type NOT LIKE 'Sammanfattning%' AND location_name NOT LIKE '% län')
+        """).fetchone()
+
+        assert result is not None
+        total_aggregated, municipality_events = result
+        assert total_aggregated == municipality_events, (
             f"Aggregated total {total_aggregated:,} != "
-            f"expected municipality events {raw_events_count['municipality']:,}"
+            f"expected municipality events {municipality_events:,}"
         )
 
-    def test_population_present_for_all(self, aggregated_data: list[dict[str, Any]]) -> None:
+    def test_population_present_for_all(self, aggregate_checks: dict[str, Any]) -> None:
         """All municipalities have population > 0."""
-        for row in aggregated_data:
-            assert row["population"] > 0, f"Zero population for {row['kommun_namn']}"
+        zero = aggregate_checks["zero_population"]
+        assert not zero, f"Zero population for: {zero}"
 
-    def test_rate_calculation_correct(self, aggregated_data: list[dict[str, Any]]) -> None:
+    def test_rate_calculation_correct(self, aggregate_checks: dict[str, Any]) -> None:
         """Rate per 10,000 calculated correctly."""
-        for row in aggregated_data:
-            if row["total_count"] > 0 and row["population"] > 0:
-                expected_rate = (row["total_count"] / row["population"]) * 10000
-                assert abs(row["rate_per_10000"] - expected_rate) < 0.001, (
-                    f"Rate mismatch for {row['kommun_namn']}: "
-                    f"got {row['rate_per_10000']}, expected {expected_rate:.4f}"
-                )
-
-    def test_has_required_columns(self, aggregated_data: list[dict[str, Any]]) -> None:
-        """Output has all required columns."""
+        mismatches = aggregate_checks["rate_mismatches"]
+        assert not mismatches, f"Rate mismatch for: {mismatches}"
+
+    def test_type_counts_sorted_descending(self, aggregate_checks: dict[str, Any]) -> None:
+        """Sparse type_counts lists the most frequent event type first."""
+        unsorted = aggregate_checks["unsorted_type_counts"]
+        assert not unsorted, f"type_counts not sorted by count for: {unsorted}"
+
+    def test_has_required_columns(
+        self, aggregated_parquet: Path, parquet_conn: duckdb.DuckDBPyConnection
+    ) -> None:
+        """Output has all required columns, with integer counts and a float rate."""
+        expected_types = {
+            "total_count": "INTEGER",
+            **dict.fromkeys(CATEGORY_COLUMNS, "INTEGER"),
+            "rate_per_10000": "DOUBLE",
+        }
         required_columns = {
             "kommun_kod",
             "kommun_namn",
-            "total_count",
-            "traffic_count",
-            "property_count",
-            "violence_count",
-            "narcotics_count",
-            "fraud_count",
-            "public_order_count",
-            "weapons_count",
-            "other_count",
             "type_counts",
             "population",
-            "rate_per_10000",
+            *expected_types,
         }
 
-        actual_columns = set(aggregated_data[0].keys())
-        missing = required_columns - actual_columns
+        column_types = dict(
+            parquet_conn.execute(f"""
+                SELECT column_name, column_type
+                FROM (DESCRIBE SELECT * FROM '{aggregated_parquet}')
+            """).fetchall()
+        )
 
+        missing = required_columns - column_types.keys()
         assert not missing, f"Missing columns: {missing}"
 
+        actual_types = {col: column_types[col] for col in expected_types}
+        assert actual_types == expected_types
+
+    def test_atomic_write_leaves_no_temp_file(self, aggregated_parquet: Path) -> None:
+        """Output is renamed into place; the .tmp file does not survive."""
+        assert aggregated_parquet.exists()
+        assert not aggregated_parquet.with_suffix(".tmp").exists()
+
 
 class TestAggregationFunction:
     """Tests for the aggregation function itself."""
@@ -148,3 +179,40 @@ class TestAggregationFunction:
         from crimecity3k.municipality_processing import aggregate_events_to_municipalities
 
         assert callable(aggregate_events_to_municipalities)
+
+    def test_type_in_two_categories_counted_once(
+        self, tmp_path: Path, test_config: Config, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A type listed under two categories is counted once, under the first."""
+        from crimecity3k import municipality_processing
+
+        events_path = tmp_path / "events.parquet"
+        population_path = tmp_path / "population.csv"
+        output_path = tmp_path / "out" / "events.parquet"
+
+        conn = duckdb.connect()
+        conn.execute(f"""
+            COPY (
+                SELECT * FROM (VALUES ('Stöld', 'Uppsala'), ('Stöld', 'Uppsala'),
+                                      ('Rån', 'Uppsala')) AS t(type, location_name)
+            ) TO '{events_path}' (FORMAT PARQUET)
+        """)
+        conn.execute(f"""
+            COPY (SELECT '0380' AS kommun_kod, 'Uppsala' AS kommun_namn, 1000 AS population)
+            TO '{population_path}' (HEADER)
+        """)
+
+        monkeypatch.setattr(
+            municipality_processing,
+            "get_category_types",
+            lambda: {"property": ["Stöld"], "violence": ["Rån", "Stöld"], "other": []},
+        )
+        municipality_processing.aggregate_events_to_municipalities(
+            events_path, population_path, output_path, test_config
+        )
+
+        row = conn.execute(f"""
+            SELECT total_count, property_count, violence_count FROM '{output_path}'
+        """).fetchone()
+        conn.close()
+        assert row == (3, 2, 1)
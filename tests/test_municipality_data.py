@@ -8,6 +8,7 @@ Tests the critical invariants for Phase 6:
 
 from pathlib import Path
 
+import duckdb
 import pytest
 
 # Mark as requiring network access for CI configuration
@@ -64,7 +65,7 @@ class TestNameMatching:
     def test_all_event_locations_match_municipalities(
         self,
         municipality_geojson: dict,
-        event_location_names: set[str],
+        municipality_location_names: set[str],
     ) -> None:
         """Every municipality-level event location matches a municipality."""
         from crimecity3k.municipality_data import normalize_name
@@ -73,29 +74,28 @@ class TestNameMatching:
             normalize_name(f["properties"]["kom_namn"]) for f in municipality_geojson["features"]
         }
 
-        # Filter to municipality-level events (exclude "* län")
-        municipality_locations = {
-            normalize_name(loc) for loc in event_location_names if not loc.endswith(" län")
-        }
+        municipality_locations = {normalize_name(loc) for loc in municipality_location_names}
 
         unmatched = municipality_locations - geojson_names
         assert not unmatched, f"Unmatched locations: {unmatched}"
 
-    def test_normalize_name_handles_case_differences(self) -> None:
-        """Name normalization handles known case differences."""
-        from crimecity3k.municipality_data import normalize_name
-
-        # These are the 5 known case differences from spike
-        test_cases = [
+    # These are the 5 known case differences from spike
+    @pytest.mark.parametrize(
+        ("input_name", "expected"),
+        [
             ("Dals-Ed", "dals-ed"),
             ("Dals-ed", "dals-ed"),
             ("Lilla Edet", "lilla edet"),
             ("Lilla edet", "lilla edet"),
             ("Upplands Väsby", "upplands väsby"),
             ("Upplands väsby", "upplands väsby"),
-        ]
-        for input_name, expected in test_cases:
-            assert normalize_name(input_name) == expected
+        ],
+    )
+    def test_normalize_name_handles_case_differences(self, input_name: str, expected: str) -> None:
+        """Name normalization handles known case differences."""
+        from crimecity3k.municipality_data import normalize_name
+
+        assert normalize_name(input_name) == expected
 
 
 # Fixtures that will be provided by conftest.py or this module
@@ -119,20 +119,21 @@ def population_data() -> list[dict]:
 
 
 @pytest.fixture(scope="module")
-def event_location_names() -> set[str]:
-    """Get all unique location_names from events data."""
-    import duckdb
+def municipality_location_names(parquet_conn: duckdb.DuckDBPyConnection) -> set[str]:
+    """Get unique municipality-level location_names from events data.
 
+    County-level locations ("* län") are dropped in the query, so Python only
+    sees the names that should match a municipality.
+    """
     events_path = Path("data/events.parquet")
     if not events_path.exists():
         pytest.skip("events.parquet not found")
 
-    conn = duckdb.connect()
-    result = conn.execute(f"""
+    result = parquet_conn.execute(f"""
         SELECT DISTINCT location_name
         FROM '{events_path}'
         WHERE location_name IS NOT NULL
+          AND location_name NOT LIKE '% län'
     """).fetchall()
-    conn.close()
 
     return {r[0] for r in result}
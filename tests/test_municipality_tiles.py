@@ -7,105 +7,142 @@ Tests the critical invariants for Task 6.3:
 - PMTiles generation works with Tippecanoe
 """
 
-import gzip
-import json
+import shutil
 from pathlib import Path
-from typing import Any
 
+import duckdb
 import pytest
 
 
-class TestMunicipalityGeoJSONExport:
-    """Tests for exporting municipality data to GeoJSONL."""
+@pytest.fixture(scope="module")
+def geojsonl_output(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Generate GeoJSONL from municipality data once for the whole module."""
+    from crimecity3k.municipality_tiles import export_municipalities_to_geojsonl
 
-    @pytest.fixture(scope="class")
-    def geojsonl_output(self, tmp_path_factory: pytest.TempPathFactory) -> Path:
-        """Generate GeoJSONL from municipality data."""
-        from crimecity3k.municipality_tiles import export_municipalities_to_geojsonl
+    boundaries_path = Path("data/municipalities/boundaries.geojson")
+    events_path = Path("data/municipalities/events.parquet")
 
-        boundaries_path = Path("data/municipalities/boundaries.geojson")
-        events_path = Path("data/municipalities/events.parquet")
+    if not boundaries_path.exists() or not events_path.exists():
+        pytest.skip("Municipality data not found - run pipeline first")
 
-        if not boundaries_path.exists() or not events_path.exists():
-            pytest.skip("Municipality data not found - run pipeline first")
+    output_dir = tmp_path_factory.mktemp("tiles")
+    output_path = output_dir / "municipalities.geojsonl.gz"
 
-        output_dir = tmp_path_factory.mktemp("tiles")
-        output_path = output_dir / "municipalities.geojsonl.gz"
+    export_municipalities_to_geojsonl(
+        boundaries_file=boundaries_path,
+        events_file=events_path,
+        output_file=output_path,
+    )
 
-        export_municipalities_to_geojsonl(
-            boundaries_file=boundaries_path,
-            events_file=events_path,
-            output_file=output_path,
-        )
+    return output_path
 
-        return output_path
 
-    @pytest.fixture(scope="class")
-    def features(self, geojsonl_output: Path) -> list[dict[str, Any]]:
-        """Parse all features from GeoJSONL output."""
-        features = []
-        with gzip.open(geojsonl_output, "rt", encoding="utf-8") as f:
-            for line in f:
-                if line.strip():
-                    features.append(json.loads(line))
-        return features
-
-    def test_output_has_290_features(self, features: list[dict[str, Any]]) -> None:
-        """GeoJSONL contains exactly 290 municipality features."""
-        assert len(features) == 290
+COUNT_PROPERTIES = [
+    "total_count",
+    "traffic_count",
+    "property_count",
+    "violence_count",
+    "narcotics_count",
+    "fraud_count",
+    "public_order_count",
+    "weapons_count",
+    "other_count",
+    "population",
+]
+REQUIRED_PROPERTIES = ["kommun_kod", "kommun_namn", *COUNT_PROPERTIES]
 
-    def test_features_have_required_properties(self, features: list[dict[str, Any]]) -> None:
-        """Each feature has all required properties for visualization."""
-        required_props = {
-            "kommun_kod",
-            "kommun_namn",
-            "total_count",
-            "traffic_count",
-            "property_count",
-            "violence_count",
-            "narcotics_count",
-            "fraud_count",
-            "public_order_count",
-            "weapons_count",
-            "other_count",
-            "population",
-        }
 
-        for feature in features:
-            props = set(feature["properties"].keys())
-            missing = required_props - props
-            assert not missing, f"Missing properties: {missing}"
+class TestMunicipalityGeoJSONExport:
+    """Tests for exporting municipality data to GeoJSONL."""
 
-    def test_features_have_valid_geometry(self, features: list[dict[str, Any]]) -> None:
-        """Each feature has valid Polygon or MultiPolygon geometry."""
-        for feature in features:
-            assert feature["type"] == "Feature"
-            assert feature["geometry"]["type"] in ("Polygon", "MultiPolygon")
-            assert "coordinates" in feature["geometry"]
+    @pytest.fixture(scope="class")
+    def features_table(self, geojsonl_output: Path, parquet_conn: duckdb.DuckDBPyConnection) -> str:
+        """Load the GeoJSONL output into a DuckDB table, one column per feature key.
+
+        read_json decompresses and parses in C++; properties and geometry become
+        STRUCT columns that tests query column-wise.
+        """
+        parquet_conn.execute(f"""
+            CREATE OR REPLACE TEMP TABLE municipality_features AS
+            SELECT * FROM read_json('{geojsonl_output}', format = 'newline_delimited')
+        """)
+        return "municipality_features"
 
-    def test_kommun_codes_are_unique(self, features: list[dict[str, Any]]) -> None:
+    @pytest.fixture(scope="class")
+    def property_types(
+        self, features_table: str, parquet_conn: duckdb.DuckDBPyConnection
+    ) -> dict[str, str]:
+        """Map each property name to the type DuckDB inferred for it."""
+        return dict(
+            parquet_conn.execute(f"""
+                SELECT column_name, column_type
+                FROM (DESCRIBE SELECT properties.* FROM {features_table})
+            """).fetchall()
+        )
+
+    def test_output_has_290_features(
+        self, features_table: str, parquet_conn: duckdb.DuckDBPyConnection
+    ) -> None:
+        """GeoJSONL contains exactly 290 municipality features."""
+        result = parquet_conn.execute(f"SELECT COUNT(*) FROM {features_table}").fetchone()
+        assert result is not None
+        assert result[0] == 290
+
+    def test_features_have_required_properties(
+        self,
+        features_table: str,
+        property_types: dict[str, str],
+        parquet_conn: duckdb.DuckDBPyConnection,
+    ) -> None:
+        """Each feature has all required properties for visualization."""
+        missing = set(REQUIRED_PROPERTIES) - property_types.keys()
+        assert not missing, f"Missing properties: {missing}"
+
+        # read_json fills a key absent from some features with NULL
+        any_null = " OR ".join(f"properties.{prop} IS NULL" for prop in REQUIRED_PROPERTIES)
+        result = parquet_conn.execute(
+            f"SELECT COUNT(*) FROM {features_table} WHERE {any_null}"
+        ).fetchone()
+        assert result is not None
+        assert result[0] == 0, f"{result[0]} features lack a required property"
+
+    def test_features_have_valid_geometry(
+        self, features_table: str, parquet_conn: duckdb.DuckDBPyConnection
+    ) -> None:
+        """Each feature has valid Polygon or MultiPolygon geometry."""
+        invalid = parquet_conn.execute(f"""
+            SELECT properties.kommun_kod, type, geometry.type
+            FROM {features_table}
+            WHERE type IS DISTINCT FROM 'Feature'
+               OR geometry.type NOT IN ('Polygon', 'MultiPolygon')
+               OR geometry.type IS NULL
+               OR geometry.coordinates IS NULL
+        """).fetchall()
+        assert not invalid, f"Invalid features (kommun_kod, type, geometry type): {invalid}"
+
+    def test_kommun_codes_are_unique(
+        self, features_table: str, parquet_conn: duckdb.DuckDBPyConnection
+    ) -> None:
         """All kommun_kod values are unique."""
-        codes = [f["properties"]["kommun_kod"] for f in features]
-        assert len(codes) == len(set(codes))
-
-    def test_counts_are_integers(self, features: list[dict[str, Any]]) -> None:
-        """Count fields are integers."""
-        count_fields = [
-            "total_count",
-            "traffic_count",
-            "property_count",
-            "violence_count",
-            "narcotics_count",
-            "fraud_count",
-            "public_order_count",
-            "weapons_count",
-            "other_count",
-            "population",
-        ]
-        for feature in features:
-            for field in count_fields:
-                value = feature["properties"][field]
-                assert isinstance(value, int), f"{field} should be int, got {type(value)}"
+        result = parquet_conn.execute(f"""
+            SELECT COUNT(*), COUNT(DISTINCT properties.kommun_kod) FROM {features_table}
+        """).fetchone()
+        assert result is not None
+        total, distinct = result
+        assert total == distinct
+
+    def test_counts_are_integers(self, property_types: dict[str, str]) -> None:
+        """Count fields are integers.
+
+        DuckDB infers an integer type for a JSON field only when every feature
+        holds an integer there, so one DESCRIBE covers all 290 features.
+        """
+        non_integer = {
+            field: property_types.get(field)
+            for field in COUNT_PROPERTIES
+            if property_types.get(field) not in ("INTEGER", "BIGINT")
+        }
+        assert not non_integer, f"Count fields should be int: {non_integer}"
 
     def test_file_is_gzip_compressed(self, geojsonl_output: Path) -> None:
         """Output file is gzip compressed."""
@@ -147,33 +184,17 @@ class TestMunicipalityPMTilesGeneration:
         assert "--maximum-zoom=10" in cmd_str
 
     @pytest.mark.skipif(
-        not Path("/usr/bin/tippecanoe").exists() and not Path("/usr/local/bin/tippecanoe").exists(),
+        not shutil.which("tippecanoe"),
         reason="Tippecanoe not installed",
     )
-    def test_generate_municipality_pmtiles(self, tmp_path: Path) -> None:
+    def test_generate_municipality_pmtiles(self, tmp_path: Path, geojsonl_output: Path) -> None:
         """Integration test: generate PMTiles from municipality data."""
-        from crimecity3k.municipality_tiles import (
-            export_municipalities_to_geojsonl,
-            generate_municipality_pmtiles,
-        )
-
-        boundaries_path = Path("data/municipalities/boundaries.geojson")
-        events_path = Path("data/municipalities/events.parquet")
-
-        if not boundaries_path.exists() or not events_path.exists():
-            pytest.skip("Municipality data not found")
+        from crimecity3k.municipality_tiles import generate_municipality_pmtiles
 
-        geojsonl_path = tmp_path / "municipalities.geojsonl.gz"
         pmtiles_path = tmp_path / "municipalities.pmtiles"
 
-        export_municipalities_to_geojsonl(
-            boundaries_file=boundaries_path,
-            events_file=events_path,
-            output_file=geojsonl_path,
-        )
-
         result = generate_municipality_pmtiles(
-            input_file=geojsonl_path,
+            input_file=geojsonl_output,
             output_file=pmtiles_path,
         )
 